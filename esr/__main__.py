@@ -28,8 +28,46 @@ def main():
         default=False,
         help="Whether or not to grab the hybrid data",
     )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="The number of browsers to scrape with in parallel; defaults to "
+             "half the available CPUs",
+    )
+    parser.add_argument(
+        "--no-static",
+        dest="prefer_static",
+        action="store_false",
+        help="Always render the reports in Chrome instead of first trying to "
+             "read the chart data from the raw HTML",
+    )
+    parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="Re-download dates that already have data in the output directory",
+    )
+    parser.add_argument(
+        "--csv",
+        dest="file_format",
+        action="store_const",
+        const="csv",
+        default="parquet",
+        help="Write each chart as CSV instead of parquet",
+    )
 
     args = parser.parse_args()
-    download_date_range(args.start, args.end, args.output, args.hybrid)
+    download_date_range(
+        args.start,
+        args.end,
+        args.output,
+        args.hybrid,
+        workers=args.workers,
+        prefer_static=args.prefer_static,
+        force=args.force,
+        file_format=args.file_format,
+    )
 
 raise SystemExit(main())
@@ -3,9 +3,9 @@ Interface to organize the data from the different chart types
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import pathlib
 import polars as pl
-import re
 
 ROOT = pathlib.Path.cwd() / "data"
 
@@ -64,6 +64,59 @@ SOC_ENUM = pl.Enum([
 
 
 
+def _series_names(enum: pl.Enum) -> dict[str, str]:
+    """
+    Map the series names as they're labelled on the ESR charts to the
+    categories of `enum`, for use with a case-insensitive `str.replace_many`.
+    Categories without any letters in them are already in canonical form
+    """
+    return {
+        category.replace("_", " "): category
+        for category in enum.categories
+        if any(char.isalpha() for char in category)
+    }
+
+AS_NAMES = _series_names(AS_ENUM)
+BID_NAMES = _series_names(BID_ENUM)
+ENERGY_NAMES = _series_names(ENERGY_ENUM)
+OFFER_NAMES = _series_names(OFFER_ENUM)
+SOC_NAMES = _series_names(SOC_ENUM)
+
+
+
+CSV_SCHEMA = {
+    "datetime": pl.Datetime,
+    "series_name": pl.String,
+    "value": pl.Float64,
+}
+
+def _series_expr(names: dict[str, str], enum: pl.Enum, alias: str) -> pl.Expr:
+    return (
+        pl.col("series_name")
+        .str.replace_many(names, ascii_case_insensitive=True)
+        .cast(enum)
+        .alias(alias)
+    )
+
+# the scraper stores parquet timestamps as naive UTC, matching what's parsed
+# out of the CSVs
+PARQUET_CASTS = [
+    pl.col("datetime").cast(pl.Datetime),
+    pl.col("series_name").cast(pl.String),
+    pl.col("value").cast(pl.Float64),
+]
+
+TIMESTAMP_EXPR = pl.col("datetime").alias("timestamp")
+VOLUME_EXPR = pl.col("value").alias("volume")
+
+AS_EXPR = _series_expr(AS_NAMES, AS_ENUM, "service")
+BID_EXPR = _series_expr(BID_NAMES, BID_ENUM, "service")
+ENERGY_EXPR = _series_expr(ENERGY_NAMES, ENERGY_ENUM, "market")
+OFFER_EXPR = _series_expr(OFFER_NAMES, OFFER_ENUM, "service")
+SOC_EXPR = _series_expr(SOC_NAMES, SOC_ENUM, "market")
+
+
+
 class EsrCollater(object):
 
     HYBRID_ROOT = ROOT / "hybrid"
@@ -80,29 +133,30 @@ class EsrCollater(object):
         "state_of_charge": r"(\d{8})_Total State of Charge.csv",
     }
 
-    def format_energy_awards(self, file_path: str) -> pl.LazyFrame:
-        return (
-            pl.scan_csv(
-                file_path,
-                schema_overrides={
-                    "datetime": pl.Datetime,
-                    "series_name": pl.String,
-                    "value": pl.Float64,
-                }
-            )
-            .drop("category")
-            .with_columns(
-                pl.col("series_name")
-                .str.to_lowercase()
-                .str.replace(r"\s", "_")
-                .cast(ENERGY_ENUM),
-            )
-            .rename({
-                "datetime": "timestamp",
-                "series_name": "market",
-                "value": "volume",
-            })
+    # every pattern is an eight-digit date followed by a fixed suffix, so the
+    # files can be picked out with a glob instead of listing the directory and
+    # running a regex over each name. The scraper can write either CSV or
+    # parquet, so the extension is left off
+    _FILE_GLOBS = {
+        dtype: (
+            8 * "[0-9]"
+            + pattern.removeprefix(r"(\d{8})").removesuffix(".csv")
         )
+        for dtype, pattern in FILE_PATTERNS.items()
+    }
+
+    def _format(self, file_path: str, series: pl.Expr) -> pl.LazyFrame:
+        # a single projection, so the column pruning, enum cast and renames
+        # all happen in one pass over the scanned files
+        if file_path.endswith(".parquet"):
+            lf = pl.scan_parquet(file_path).with_columns(PARQUET_CASTS)
+        else:
+            lf = pl.scan_csv(file_path, schema_overrides=CSV_SCHEMA)
+
+        return lf.select(TIMESTAMP_EXPR, series, VOLUME_EXPR)
+
+    def format_energy_awards(self, file_path: str) -> pl.LazyFrame:
+        return self._format(file_path, ENERGY_EXPR)
 
     def format_fmm_as_awards(self, file_path: str) -> pl.LazyFrame:
         return self.format_ifm_as_awards(file_path)
@@ -114,100 +168,16 @@ class EsrCollater(object):
         return self.format_ifm_offers(file_path)
 
     def format_ifm_as_awards(self, file_path: str) -> pl.LazyFrame:
-        return (
-            pl.scan_csv(
-                file_path,
-                schema_overrides={
-                    "datetime": pl.Datetime,
-                    "series_name": pl.String,
-                    "value": pl.Float64,
-                }
-            )
-            .drop("category")
-            .with_columns(
-                pl.col("series_name")
-                .str.to_lowercase()
-                .str.replace(r"\s", "_")
-                .cast(AS_ENUM),
-            )
-            .rename({
-                "datetime": "timestamp",
-                "series_name": "service",
-                "value": "volume",
-            })
-        )
+        return self._format(file_path, AS_EXPR)
 
     def format_ifm_bids(self, file_path: str) -> pl.LazyFrame:
-        return (
-            pl.scan_csv(
-                file_path,
-                schema_overrides={
-                    "datetime": pl.Datetime,
-                    "series_name": pl.String,
-                    "value": pl.Float64,
-                }
-            )
-            .drop("category")
-            .with_columns(
-                pl.col("series_name")
-                .str.to_lowercase()
-                .replace({"self schedule": "self_schedule"})
-                .cast(BID_ENUM),
-            )
-            .rename({
-                "datetime": "timestamp",
-                "series_name": "service",
-                "value": "volume",
-            })
-        )
+        return self._format(file_path, BID_EXPR)
 
     def format_ifm_offers(self, file_path: str) -> pl.LazyFrame:
-        return (
-            pl.scan_csv(
-                file_path,
-                schema_overrides={
-                    "datetime": pl.Datetime,
-                    "series_name": pl.String,
-                    "value": pl.Float64,
-                }
-            )
-            .drop("category")
-            .with_columns(
-                pl.col("series_name")
-                .str.to_lowercase()
-                .replace({"self schedule": "self_schedule"})
-                .cast(OFFER_ENUM),
-            )
-            .rename({
-                "datetime": "timestamp",
-                "series_name": "service",
-                "value": "volume",
-            })
-        )
+        return self._format(file_path, OFFER_EXPR)
 
     def format_state_of_charge(self, file_path: str) -> pl.LazyFrame:
-        return (
-            pl.scan_csv(
-                file_path,
-                schema_overrides={
-                    "datetime": pl.Datetime,
-                    "series_name": pl.String,
-                    "value": pl.Float64,
-                }
-            )
-            .drop("category")
-            .with_columns(
-                pl.col("series_name")
-                .str.to_lowercase()
-                .replace({"self schedule": "self_schedule"})
-                .cast(SOC_ENUM),
-            )
-            .rename({
-                "datetime": "timestamp",
-                "series_name": "market",
-                "value": "volume",
-            })
-        )
+        return self._format(file_path, SOC_EXPR)
 
 
 
@@ -215,10 +185,29 @@ class EsrCollater(object):
     # Primary method
     # 
 
-    def collate(self, dtype: str, btype: str = "storage") -> pl.LazyFrame:
+    def collate(
+        self,
+        dtype: str,
+        btype: str = "storage",
+        sort: bool = True,
+    ) -> pl.LazyFrame:
+        """
+        Combine every downloaded file of one chart type into a single frame
+
+        Parameters:
+        dtype (str): One of the keys of `FILE_PATTERNS`
+        btype (str): 'storage' or 'hybrid'
+        sort (bool): Sort by timestamp and market/service. Without the sort,
+            rows come one day after another within each file format, but all
+            the CSV days come before all the parquet days; that's only
+            chronological if every CSV day predates the parquet ones (as it
+            does when old downloads are CSV and new ones parquet)
+
+        Returns:
+        pl.LazyFrame: The formatted rows of every matching file
+        """
         try:
-            pattern_str = self.FILE_PATTERNS[dtype]
-            pattern = re.compile(pattern_str)
+            glob = self._FILE_GLOBS[dtype]
         except KeyError as exc:
             valid = ", ".join(map(lambda s: f"'{s}'", self.FILE_PATTERNS.keys()))
             raise ValueError(
@@ -238,18 +227,33 @@ class EsrCollater(object):
         # lol
         formatter = getattr(self, f"format_{dtype}")
 
-        frames = []
-        for csv in root.iterdir():
-            if pattern.match(csv.name):
-                lf = formatter(csv)
-                frames.append(lf)
+        # all the files for a dtype share a schema, so let polars expand the glob
+        # and read them in parallel as a single frame per file format. CSV goes
+        # first since those are the older downloads
+        frames = [
+            formatter(str(root / (glob + ext)))
+            for ext in (".csv", ".parquet")
+            if next(root.glob(glob + ext), None) is not None
+        ]
+        if not frames:
+            raise ValueError(f"no '{dtype}' files were found in {root}")
+
+        lf = pl.concat(frames, how="vertical")
+
+        # each format's glob expands in file-name order, i.e. one day after
+        # another, and each day's rows are already time-ordered; the full sort
+        # settles the order across formats (see the docstring) and of the
+        # series within each timestamp, so skip it when that doesn't matter
+        # downstream
+        if not sort:
+            return lf
 
         if (dtype == "energy_awards") or (dtype == "state_of_charge"):
             by = ["timestamp", "market"]
         else:
             by = ["timestamp", "service"]
 
-        return pl.concat(frames, how="vertical").sort(by)
+        return lf.sort(by)
 
 if __name__ == "__main__":
     col = EsrCollater()
@@ -257,6 +261,21 @@ if __name__ == "__main__":
     SINK = pathlib.Path.cwd() / "data" / "formatted" / "storage"
     SINK.mkdir(parents=True, exist_ok=True)
 
-    for dtype in col.FILE_PATTERNS.keys():
+    def sink(dtype: str) -> None:
         lf = col.collate(dtype)
-        lf.sink_parquet(SINK / f"{dtype}.parquet")
+
+        # run the scan -> format -> sort -> write pipeline on the streaming
+        # engine. The final sort still has to buffer every row, but the
+        # scanning and formatting stream through without intermediate copies
+        lf.sink_parquet(
+            SINK / f"{dtype}.parquet",
+            compression="zstd",
+            engine="streaming",
+        )
+
+    # polars releases the GIL while it reads and writes, so the dtypes can be
+    # sunk side by side
+    dtypes = list(col.FILE_PATTERNS.keys())
+    with ThreadPoolExecutor(max_workers=len(dtypes)) as pool:
+        list(pool.map(sink, dtypes))
+
@@ -1,32 +1,63 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+import numpy as np
 import pandas as pd
+import polars as pl
+import asyncio
+import atexit
+import bisect
+import concurrent.futures
+import csv
+import functools
+import html
 import json
-import time
+import os
+import re
+import requests
+import threading
 import pathlib
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def extract_caiso_charts_with_titles(
-    url: str,
-    hybrid: bool = False,
+
+
+def make_driver(
     headless: bool = True,
-):
+    minimal_assets: bool = True,
+    block_stylesheets: bool = False,
+) -> webdriver.Chrome:
     """
-    Extract CAISO chart data with proper title detection
+    Launch a Chrome driver configured for scraping the CAISO reports
 
     Parameters:
-    url (str): CAISO daily energy storage report URL
     headless (bool): Run browser in headless mode
+    minimal_assets (bool): Don't load images, show notifications, or run
+        Chrome's background services; the chart data lives in the page's
+        scripts, so none of them are needed
+    block_stylesheets (bool): Also skip the page's CSS. Off by default since
+        the chart titles are matched by their rendered position, and the
+        Storage/Hybrid tabs are only hidden by the stylesheets
 
     Returns:
-    dict: Extracted chart data with titles
+    webdriver.Chrome: A fresh Chrome driver; the caller is responsible for
+        calling `quit` on it
     """
-
-    # Setup Chrome driver
     chrome_options = Options()
     if headless:
         chrome_options.add_argument("--headless")
@@ -34,7 +65,252 @@ def extract_caiso_charts_with_titles(
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--window-size=1920,1080")
 
-    driver = webdriver.Chrome(options=chrome_options)
+    if minimal_assets:
+        prefs = {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        }
+        if block_stylesheets:
+            prefs["profile.managed_default_content_settings.stylesheets"] = 2
+
+        chrome_options.add_experimental_option("prefs", prefs)
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+
+        # nothing Chrome does in the background matters to a one-page scrape
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--disable-features=Translate")
+
+    # every page load is dozens of commands to chromedriver; keep-alive has
+    # them reuse one pooled connection instead of a new handshake apiece. Each
+    # driver is only ever used from one thread, so the pool needs no more
+    # than the one connection
+    return webdriver.Chrome(options=chrome_options, keep_alive=True)
+
+# orjson, when it's installed, is several times faster than the standard
+# library on the multi-megabyte chart payloads; its decode errors subclass
+# json's, so either can be caught the same way
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+_CHARTS_READY_JS = """
+if (typeof Highcharts === 'undefined') { return false; }
+var charts = Highcharts.charts.filter(function(c) { return c; });
+return charts.length > 0 && charts.every(function(c) {
+    return c.series && c.series.length && c.series[0].data.length > 0;
+});
+"""
+
+_EXTRACTION_JS_SOURCE = """
+// the candidate titles only matter in here; python just gets their count
+var titles = [];
+var result = {
+    titleCount: 0,
+    charts: []
+};
+
+// First, extract all potential titles from the page
+var titleElements = document.querySelectorAll('h1, h2, h3, h4, h5, h6, .title, [class*="title"], [class*="heading"]');
+titleElements.forEach(function(el) {
+    var text = el.textContent.trim();
+    if (text && text.length > 3 && text.length < 100) {
+        titles.push({
+            text: text,
+            position: el.getBoundingClientRect(),
+            tagName: el.tagName,
+            className: el.className
+        });
+    }
+});
+
+// Sort the titles by where they end on the page (the sort is stable, so ties
+// stay in page order), so each chart's candidates can be binary searched
+titles.sort(function(a, b) {
+    return a.position.bottom - b.position.bottom;
+});
+result.titleCount = titles.length;
+
+// Extract Highcharts data
+if (typeof Highcharts !== 'undefined' && Highcharts.charts) {
+    Highcharts.charts.forEach(function(chart, chartIndex) {
+        if (chart && chart.series && chart.container) {
+            var chartRect = chart.container.getBoundingClientRect();
+
+            // Find the closest title above this chart
+            var bestTitle = 'Chart ' + chartIndex;
+            var bestDistance = Infinity;
+
+            // Binary search for the first title that ends below the chart's top
+            var lo = 0;
+            var hi = titles.length;
+            while (lo < hi) {
+                var mid = (lo + hi) >> 1;
+                if (titles[mid].position.bottom <= chartRect.top) {
+                    lo = mid + 1;
+                } else {
+                    hi = mid;
+                }
+            }
+
+            // Walk back up the page from there; the titles only get further
+            // from the chart, so stop once they're out of range
+            for (var i = lo - 1; i >= 0; i--) {
+                var titleInfo = titles[i];
+                var distance = chartRect.top - titleInfo.position.bottom;
+                if (distance >= 200 || distance > bestDistance) {
+                    break;
+                }
+
+                var horizontalOverlap = Math.min(titleInfo.position.right, chartRect.right) -
+                                      Math.max(titleInfo.position.left, chartRect.left);
+
+                // Prefer titles that are close vertically and have some
+                // horizontal overlap; on a tie, the one earlier in the page
+                // wins, since it's reached last
+                if (horizontalOverlap > 0) {
+                    bestDistance = distance;
+                    bestTitle = titleInfo.text;
+                }
+            }
+
+            var chartData = {
+                chartIndex: chartIndex,
+                title: bestTitle,
+                chartPosition: chartRect,
+                series: []
+            };
+
+            chart.series.forEach(function(series) {
+                // one array per field rather than one object per point keeps
+                // the payload small and lets python build columns directly
+                var seriesData = {
+                    name: series.name || 'Series ' + series.index,
+                    type: series.type,
+                    xs: [],
+                    ys: [],
+                    datetimes: [],
+                    categories: []
+                };
+
+                series.data.forEach(function(point) {
+                    seriesData.xs.push(point.x);
+                    seriesData.ys.push(point.y);
+
+                    // Handle datetime
+                    seriesData.datetimes.push(
+                        (typeof point.x === 'number' && point.x > 1000000000000)
+                            ? new Date(point.x).toISOString()
+                            : null
+                    );
+
+                    // Handle categories
+                    seriesData.categories.push(
+                        point.category !== undefined ? point.category : null
+                    );
+                });
+                chartData.series.push(seriesData);
+            });
+
+            result.charts.push(chartData);
+        }
+    });
+}
+
+return result;
+"""
+
+def _minify_js(source: str) -> str:
+    # drop the comment lines and indentation, and wrap the script in a
+    # function so V8 can cache its compiled form between pages. Newlines are
+    # kept so automatic semicolon insertion still works.
+    #
+    # The result comes back as a single JSON string: WebDriver's own
+    # serialization walks the multi-megabyte payload value by value on both
+    # ends, while a string is passed through untouched and can then be
+    # decoded with orjson
+    lines = (line.strip() for line in source.splitlines())
+    body = "\n".join(
+        line for line in lines
+        if line and (not line.startswith("//"))
+    )
+    return "return JSON.stringify((function() {\n" + body + "\n})());"
+
+# sent to chromedriver once per page, so it's prepared once here
+_EXTRACTION_JS = _minify_js(_EXTRACTION_JS_SOURCE)
+
+# each thread lazily launches its own headless driver and keeps it for every
+# page it scrapes; launching Chrome takes longer than scraping a page
+_LOCAL = threading.local()
+_DRIVERS: set[webdriver.Chrome] = set()
+_DRIVERS_LOCK = threading.Lock()
+
+def _get_driver() -> webdriver.Chrome:
+    """
+    Return the calling thread's shared headless driver, launching it on first
+    use. It's kept alive until `_reset_driver` or `_quit_all_drivers` is
+    called, or the interpreter exits
+    """
+    driver = getattr(_LOCAL, "driver", None)
+    if driver is None:
+        driver = make_driver(headless=True)
+        _LOCAL.driver = driver
+        with _DRIVERS_LOCK:
+            _DRIVERS.add(driver)
+    return driver
+
+def _quit(driver: webdriver.Chrome) -> None:
+    try:
+        driver.quit()
+    except WebDriverException:
+        # the session was already lost
+        pass
+
+def _reset_driver() -> None:
+    """
+    Quit the calling thread's driver, so the next `_get_driver` relaunches it
+    """
+    driver = getattr(_LOCAL, "driver", None)
+    if driver is not None:
+        _LOCAL.driver = None
+        with _DRIVERS_LOCK:
+            _DRIVERS.discard(driver)
+        _quit(driver)
+
+def _quit_all_drivers() -> None:
+    _LOCAL.driver = None
+    with _DRIVERS_LOCK:
+        drivers = list(_DRIVERS)
+        _DRIVERS.clear()
+
+    for driver in drivers:
+        _quit(driver)
+
+atexit.register(_quit_all_drivers)
+
+def extract_caiso_charts_with_titles(
+    url: str,
+    hybrid: bool = False,
+    headless: bool = True,
+    driver: webdriver.Chrome | None = None,
+):
+    """
+    Extract CAISO chart data with proper title detection
+
+    Parameters:
+    url (str): CAISO daily energy storage report URL
+    headless (bool): Run browser in headless mode
+    driver (webdriver.Chrome): An already-running driver to load the page in.
+        If not provided, a new one is launched and quit before returning
+
+    Returns:
+    dict: Extracted chart data with titles
+    """
+    owns_driver = driver is None
+    if owns_driver:
+        driver = make_driver(headless=headless)
+    else:
+        # don't let one report's session state leak into the next
+        driver.delete_all_cookies()
 
     try:
         print(f"Loading: {url}")
@@ -54,99 +330,20 @@ def extract_caiso_charts_with_titles(
                  ".highcharts-container, svg, canvas")
             )
         )
-        time.sleep(5)  # Additional wait for JavaScript
-
-        extraction_script = """
-        var result = {
-            titles: [],
-            charts: []
-        };
-
-        // First, extract all potential titles from the page
-        var titleElements = document.querySelectorAll('h1, h2, h3, h4, h5, h6, .title, [class*="title"], [class*="heading"]');
-        titleElements.forEach(function(el) {
-            var text = el.textContent.trim();
-            if (text && text.length > 3 && text.length < 100) {
-                result.titles.push({
-                    text: text,
-                    position: el.getBoundingClientRect(),
-                    tagName: el.tagName,
-                    className: el.className
-                });
-            }
-        });
-
-        // Extract Highcharts data
-        if (typeof Highcharts !== 'undefined' && Highcharts.charts) {
-            Highcharts.charts.forEach(function(chart, chartIndex) {
-                if (chart && chart.series && chart.container) {
-                    var chartRect = chart.container.getBoundingClientRect();
-
-                    // Find the closest title above this chart
-                    var bestTitle = 'Chart ' + chartIndex;
-                    var bestDistance = Infinity;
-
-                    result.titles.forEach(function(titleInfo) {
-                        // Check if title is above the chart and reasonably close
-                        if (titleInfo.position.bottom <= chartRect.top) {
-                            var distance = chartRect.top - titleInfo.position.bottom;
-                            var horizontalOverlap = Math.min(titleInfo.position.right, chartRect.right) -
-                                                  Math.max(titleInfo.position.left, chartRect.left);
-
-                            // Prefer titles that are close vertically and have some horizontal overlap
-                            if (distance < 200 && horizontalOverlap > 0 && distance < bestDistance) {
-                                bestDistance = distance;
-                                bestTitle = titleInfo.text;
-                            }
-                        }
-                    });
-
-                    var chartData = {
-                        chartIndex: chartIndex,
-                        title: bestTitle,
-                        chartPosition: chartRect,
-                        series: []
-                    };
-
-                    chart.series.forEach(function(series) {
-                        var seriesData = {
-                            name: series.name || 'Series ' + series.index,
-                            type: series.type,
-                            data: series.data.map(function(point) {
-                                var dataPoint = {
-                                    x: point.x,
-                                    y: point.y
-                                };
-
-                                // Handle datetime
-                                if (typeof point.x === 'number' && point.x > 1000000000000) {
-                                    dataPoint.datetime = new Date(point.x).toISOString();
-                                }
-
-                                // Handle categories
-                                if (point.category !== undefined) {
-                                    dataPoint.category = point.category;
-                                }
-
-                                return dataPoint;
-                            })
-                        };
-                        chartData.series.push(seriesData);
-                    });
-
-                    result.charts.push(chartData);
-                }
-            });
-        }
-
-        return result;
-        """
+        # wait for Highcharts to have populated the charts, rather than
+        # sleeping for a fixed amount of time. A chart that legitimately has no
+        # data would hold this up until the timeout, so extract whatever has
+        # rendered by then instead of giving up on the day
+        try:
+            wait.until(lambda d: d.execute_script(_CHARTS_READY_JS))
+        except TimeoutException:
+            print("! Timed out waiting for chart data; extracting anyway")
 
         # Execute the extraction script
-        extracted_data = driver.execute_script(extraction_script)
+        extracted_data = _json_loads(driver.execute_script(_EXTRACTION_JS))
 
         print(f"✓ Found {len(extracted_data['charts'])} charts")
-        print(f"✓ Found {len(extracted_data['titles'])} potential titles")
+        print(f"✓ Found {extracted_data['titleCount']} potential titles")
 
         # Print the matched titles
         for chart in extracted_data['charts']:
@@ -156,7 +353,302 @@ def extract_caiso_charts_with_titles(
         return extracted_data
 
     finally:
-        driver.quit()
+        if owns_driver:
+            driver.quit()
+
+_SCRIPT_RE = re.compile(
+    r"<script[^>]*>(.*?)</script>",
+    flags=re.DOTALL | re.IGNORECASE,
+)
+_CHART_KEYWORD_RE = re.compile(r"chart|series|data")
+_CHART_RE = re.compile(r"Highcharts\.(?:chart|Chart)\s*\(")
+_HEADING_RE = re.compile(
+    r"<(h[1-6])\b[^>]*>(.*?)</\1>",
+    flags=re.DOTALL | re.IGNORECASE,
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+def _iter_json_spans(text: str):
+    """
+    Yield every top-level `{...}` span in `text`, in a single linear pass.
+    Braces inside quoted strings are skipped, so the spans are balanced but
+    not necessarily valid JSON
+    """
+    depth = 0
+    start = 0
+    quote = None
+    escaped = False
+
+    for i, char in enumerate(text):
+        if quote is not None:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "{":
+            if depth == 0:
+                start = i
+            depth += 1
+        elif char == "}" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                yield text[start:i + 1]
+
+def _xy_from_config(point, index: int, series: dict) -> tuple:
+    # Highcharts accepts bare y-values, [x, y] pairs, or point objects
+    if isinstance(point, dict):
+        return point.get("x", index), point.get("y")
+    if isinstance(point, list):
+        return point[0], point[1]
+    x = series.get("pointStart", 0) + index * series.get("pointInterval", 1)
+    return x, point
+
+def _series_from_config(
+    series: dict,
+    name: str,
+    series_type: str,
+    categories: list | None,
+) -> dict:
+    xs, ys = [], []
+    for i, point in enumerate(series.get("data", [])):
+        x, y = _xy_from_config(point, i, series)
+        xs.append(x)
+        ys.append(y)
+
+    datetimes = [
+        pd.Timestamp(x, unit="ms", tz="UTC")
+        .strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+        if isinstance(x, (int, float)) and x > 1_000_000_000_000
+        else None
+        for x in xs
+    ]
+
+    # mirror Highcharts' `point.category`, which falls back to the x value on
+    # non-categorical axes
+    if categories:
+        categories = [
+            categories[x]
+            if isinstance(x, int) and (0 <= x < len(categories))
+            else x
+            for x in xs
+        ]
+    else:
+        categories = list(xs)
+
+    return {
+        "name": name,
+        "type": series_type,
+        "xs": xs,
+        "ys": ys,
+        "datetimes": datetimes,
+        "categories": categories,
+    }
+
+def _chart_from_config(
+    config: dict,
+    chart_index: int,
+    heading: str | None = None,
+) -> dict | None:
+    # the browser names charts after the page heading above them, and the
+    # file names (which collate matches on) have to agree with it, so the
+    # config's own title only stands in when there's no heading
+    title = config.get("title")
+    title = title.get("text") if isinstance(title, dict) else None
+    title = heading or title
+    series = config.get("series")
+    if (not isinstance(title, str)) or (not isinstance(series, list)):
+        return None
+
+    x_axis = config.get("xAxis") or {}
+    if isinstance(x_axis, list):
+        x_axis = x_axis[0] if x_axis else {}
+    categories = x_axis.get("categories")
+
+    default_type = (config.get("chart") or {}).get("type", "line")
+
+    chart_data = {"chartIndex": chart_index, "title": title, "series": []}
+    for series_index, s in enumerate(series):
+        if not isinstance(s, dict):
+            return None
+        chart_data["series"].append(_series_from_config(
+            s,
+            s.get("name") or f"Series {series_index}",
+            s.get("type", default_type),
+            categories,
+        ))
+
+    return chart_data
+
+def _heading_titles(page: str) -> tuple[list[int], list[str]]:
+    # positions are the end of each heading, so a bisect on a chart's offset
+    # finds the closest heading above it
+    ends, titles = [], []
+    for match in _HEADING_RE.finditer(page):
+        text = html.unescape(_TAG_RE.sub("", match.group(2))).strip()
+        # same length limits as the browser's title candidates
+        if 3 < len(text) < 100:
+            ends.append(match.end())
+            titles.append(text)
+    return ends, titles
+
+def _charts_from_calls(page: str) -> list[dict] | None:
+    """
+    Pull the options object out of every `Highcharts.chart(...)` call in the
+    page, each named after the nearest heading above it (or its own
+    `title.text` if there is none). Returns None if any call can't be read,
+    since writing only some of a day's charts would pass for a finished
+    download
+    """
+    ends, titles = _heading_titles(page)
+
+    charts = []
+    for match in _CHART_RE.finditer(page):
+        # the options object is the first `{...}` in the call; a leading
+        # container-id argument is a quoted string, which the scanner skips
+        stop = page.find("</script>", match.end())
+        call = page[match.end():stop if stop >= 0 else len(page)]
+        span = next(_iter_json_spans(call), None)
+        if span is None:
+            return None
+
+        try:
+            config = _json_loads(span)
+        except json.JSONDecodeError:
+            return None
+
+        if not isinstance(config, dict):
+            return None
+
+        above = bisect.bisect_right(ends, match.start()) - 1
+        heading = titles[above] if above >= 0 else None
+        chart = _chart_from_config(config, len(charts), heading)
+        if chart is None:
+            return None
+        charts.append(chart)
+
+    return charts
+
+def _charts_from_scripts(page: str) -> list[dict] | None:
+    # slower catch-all for pages that assign their configs to variables
+    # rather than passing them straight to `Highcharts.chart`. Any object
+    # that mentions `series` but can't be read as a chart (e.g. one holding
+    # a JS function) gives up on the page, like `_charts_from_calls`
+    charts = []
+    for script in _SCRIPT_RE.findall(page):
+        if not _CHART_KEYWORD_RE.search(script):
+            continue
+
+        for span in _iter_json_spans(script):
+            try:
+                config = _json_loads(span)
+            except json.JSONDecodeError:
+                if "series" in span:
+                    return None
+                continue
+
+            if isinstance(config, dict) and ("series" in config):
+                chart = _chart_from_config(config, len(charts))
+                if chart is None:
+                    return None
+                charts.append(chart)
+
+    return charts
+
+def _charts_from_html(html: str) -> dict | None:
+    # valid JSON can still have a shape the parsers don't expect (`data:
+    # null`, one-element points, a string `xAxis`, ...); treat those pages
+    # as misses and leave them to the browser
+    try:
+        charts = _charts_from_calls(html)
+        if charts == []:
+            charts = _charts_from_scripts(html)
+    except (TypeError, ValueError, IndexError, AttributeError):
+        return None
+
+    # the storage and hybrid tabs reuse chart titles, and without the rendered
+    # layout there's no telling them apart; leave those pages to the browser
+    if not charts:
+        return None
+
+    titles = [chart["title"] for chart in charts]
+    if len(titles) != len(set(titles)):
+        return None
+
+    print(f"✓ Found {len(charts)} static charts")
+    return {"titleCount": 0, "charts": charts}
+
+def fetch_static_charts(url: str, timeout: float = 10) -> dict | None:
+    """
+    Try to pull the chart data from the raw HTML of the report, without
+    starting a browser
+
+    Parameters:
+    url (str): CAISO daily energy storage report URL
+    timeout (float): Seconds to wait on the HTTP request
+
+    Returns:
+    dict | None: Extracted chart data in the same layout as
+        `extract_caiso_charts_with_titles`, or None if the page doesn't embed
+        its chart configurations as static JSON
+    """
+    print(f"Fetching: {url}")
+    try:
+        response = requests.get(url, timeout=timeout)
+        response.raise_for_status()
+    except requests.RequestException:
+        return None
+
+    return _charts_from_html(response.text)
+
+async def fetch_all(
+    urls: list[str],
+    concurrency: int = 16,
+    timeout: float = 10,
+) -> list[dict | None]:
+    """
+    Concurrently try the static fast path on many reports. Requires aiohttp
+
+    Parameters:
+    urls (list[str]): CAISO daily energy storage report URLs
+    concurrency (int): The most requests to have in flight at once
+    timeout (float): Seconds to wait on each HTTP request
+
+    Returns:
+    list[dict | None]: The `fetch_static_charts` result for each URL, in order
+    """
+    if aiohttp is None:
+        raise ImportError(
+            "fetch_all requires aiohttp; install it with the 'fast' extra, "
+            "e.g. `pip install esr[fast]`"
+        )
+
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+
+    async def fetch(session: aiohttp.ClientSession, url: str) -> dict | None:
+        async with semaphore:
+            print(f"Fetching: {url}")
+            try:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    html = await response.text()
+            except (
+                aiohttp.ClientError,
+                asyncio.TimeoutError,
+                UnicodeDecodeError,
+            ):
+                return None
+
+        # scanning the scripts is CPU-bound, so keep it off the event loop
+        return await loop.run_in_executor(None, _charts_from_html, html)
+
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    async with aiohttp.ClientSession(timeout=client_timeout) as session:
+        return await asyncio.gather(*(fetch(session, url) for url in urls))
 
 def convert_to_dataframes(extracted_data):
     """
@@ -180,30 +672,41 @@ def convert_to_dataframes(extracted_data):
         if chart_title.startswith("Chart"):
             continue
 
-        # Combine all series into a single DataFrame for this chart
-        all_data = []
+        # Combine all series into a single DataFrame for this chart; each
+        # series already arrives as one array per field
+        names, values, datetimes, xs, categories = [], [], [], [], []
 
         for series in chart["series"]:
-            for point in series["data"]:
-                row = {
-                    "series_name": series["name"],
-                    "value": point["y"]
-                }
+            names.extend([series["name"]] * len(series["ys"]))
+            values.extend(series["ys"])
 
-                # Add time information
-                if "datetime" in point:
-                    row["datetime"] = pd.to_datetime(point["datetime"])
-                else:
-                    row["x"] = point["x"]
+            # Add time information
+            datetimes.extend(series["datetimes"])
+            xs.extend(
+                None if dt is not None else x
+                for x, dt in zip(series["xs"], series["datetimes"])
+            )
 
-                # Add category if available
-                if "category" in point:
-                    row["category"] = point["category"]
+            # Add category if available
+            categories.extend(series["categories"])
 
-                all_data.append(row)
+        if names:
+            columns = {"series_name": names, "value": values}
+            if any(dt is not None for dt in datetimes):
+                # these all come from JS's `Date.toISOString`, so spelling out
+                # the format skips pandas' per-value format inference
+                columns["datetime"] = pd.to_datetime(
+                    datetimes,
+                    format="%Y-%m-%dT%H:%M:%S.%fZ",
+                    utc=True,
+                    cache=True,
+                )
+            if any(x is not None for x in xs):
+                columns["x"] = xs
+            if any(category is not None for category in categories):
+                columns["category"] = categories
 
-        if all_data:
-            df = pd.DataFrame(all_data)
+            df = pd.DataFrame(columns)
 
             # If we have datetime, set it as index
             if "datetime" in df.columns:
@@ -219,66 +722,279 @@ def convert_to_dataframes(extracted_data):
 with open("esr/anomalous_dates.json", "r") as file:
     ANOMALOUS_DATES = json.load(file)
 
-def format_url(date: str) -> str:
-    date = pd.to_datetime(date)
+_MONS = (
+    "", "jan", "feb", "mar", "apr", "may", "jun",
+    "jul", "aug", "sep", "oct", "nov", "dec",
+)
 
-    if (date.year == 2022) or (date.year == 2023):
-        date_str = date.strftime("%b%d-%Y").lower()
-        date_str = ANOMALOUS_DATES.get(date_str, date_str)
+# CAISO has renamed the report pages over time. Each rule is the first date it
+# applies to, the separator between month and day in the page's date (so it
+# reads like `may-08-2025` or `may08-2025`), and the page name template; the
+# most recent rule comes first
+_URL_RULES = [
+    (
+        pd.Timestamp("2024-05-24"),
+        "-",
+        "daily-energy-storage-report-{}.html",
+    ),
+    (
+        pd.Timestamp("2022-01-01"),
+        "",
+        "dailyenergystoragereport{}.html",
+    ),
+    # nothing earlier is known to exist; keep the naming these dates have
+    # always been given
+    (
+        pd.Timestamp.min,
+        "-",
+        "daily-energy-storage-report-{}.html",
+    ),
+]
 
-        return (
-            "https://www.caiso.com/documents/"
-            f"dailyenergystoragereport{date_str}.html"
-        )
-    else:
-        if (
-            (date.year == 2024) &
-            ((date.month < 5) | ((date.month == 5) & (date.day < 24)))
-        ):
-            date_str = date.strftime("b%d-%Y")
-            date_str = ANOMALOUS_DATES.get(date_str, date_str)
+@functools.lru_cache(maxsize=None)
+def format_url(date: str | pd.Timestamp) -> str:
+    if not isinstance(date, pd.Timestamp):
+        date = pd.to_datetime(date)
 
-            return (
-                "https://www.caiso.com/documents/"
-                f"dailyenergystoragereport{date_str}.html"
+    for start, separator, page in _URL_RULES:
+        if date >= start:
+            # spelled out by hand rather than `strftime("%b")`, which is
+            # locale-dependent and already needs lowercasing
+            date_str = (
+                f"{_MONS[date.month]}{separator}{date.day:02d}-{date.year}"
             )
-        else:
-            date_str = date.strftime("%b-%d-%Y").lower()
             date_str = ANOMALOUS_DATES.get(date_str, date_str)
-            return (
-                "https://www.caiso.com/documents/"
-                f"daily-energy-storage-report-{date_str}.html"
-            )
+            return "https://www.caiso.com/documents/" + page.format(date_str)
+
+def format_urls(dates: pd.DatetimeIndex) -> list[str]:
+    """
+    Vectorized `format_url` over a whole range of dates, for when every URL is
+    wanted up front
+    """
+    dates = pd.DatetimeIndex(dates)
+    months = np.asarray(_MONS, dtype=object)[dates.month]
+    days = dates.strftime("%d-%Y").to_numpy(dtype=object)
+
+    # the rules run newest first, so fill in from the oldest and let each
+    # newer rule overwrite the dates it covers
+    urls = np.full(len(dates), None, dtype=object)
+    for start, separator, page in reversed(_URL_RULES):
+        date_strs = (
+            pd.Series(months + separator + days)
+            .replace(ANOMALOUS_DATES)
+            .to_numpy()
+        )
+        head, tail = page.split("{}")
+        urls = np.where(
+            dates >= start,
+            "https://www.caiso.com/documents/" + head + date_strs + tail,
+            urls,
+        )
+
+    return urls.tolist()
 
 
 
+def _extract_with_shared_driver(url: str, hybrid: bool) -> dict:
+    try:
+        return extract_caiso_charts_with_titles(
+            url,
+            hybrid=hybrid,
+            driver=_get_driver(),
+        )
+    except InvalidSessionIdException:
+        # Chrome crashed or dropped the session; relaunch it and retry once
+        _reset_driver()
+        return extract_caiso_charts_with_titles(
+            url,
+            hybrid=hybrid,
+            driver=_get_driver(),
+        )
+
 def read_single_day_data(
     date: str | pd.Timestamp,
     target_dir: str | pathlib.Path,
     hybrid: bool,
+    driver: webdriver.Chrome | None = None,
+    prefer_static: bool = True,
+    file_format: str = "parquet",
+    force: bool = False,
 ) -> None:
-    date = pd.to_datetime(date)
+    if not isinstance(date, pd.Timestamp):
+        date = pd.to_datetime(date)
+    target_dir = pathlib.Path(target_dir)
+
+    if (not force) and _is_downloaded(date, target_dir):
+        print(f"Skipping {date.date()}; already downloaded")
+        return
+
     url = format_url(date)
 
-    data = extract_caiso_charts_with_titles(url, hybrid=hybrid, headless=True)
+    # the static page can't be switched to the hybrid tab, so those always
+    # need the browser
+    data = None
+    if prefer_static and (not hybrid):
+        data = fetch_static_charts(url)
+
+    if data is None:
+        if driver is None:
+            data = _extract_with_shared_driver(url, hybrid)
+        else:
+            data = extract_caiso_charts_with_titles(
+                url,
+                hybrid=hybrid,
+                driver=driver,
+            )
+    _write_charts(date, data, target_dir, file_format)
+
+def _to_polars(frame: pd.DataFrame) -> pl.DataFrame:
+    # going through plain numpy columns lets polars take the frame without
+    # needing pyarrow for pandas' string and timezone-aware extension dtypes.
+    # Missing values come out as nulls in every format, never NaN
+    columns = {}
+    for name, col in frame.items():
+        if (
+            pd.api.types.is_numeric_dtype(col)
+            or pd.api.types.is_datetime64_dtype(col)
+        ):
+            columns[name] = col.to_numpy()
+        else:
+            # strings and mixed-type columns (e.g. categories) go out as text
+            columns[name] = np.where(col.isna(), None, col.astype(str))
+
+    return pl.DataFrame(columns, nan_to_null=True)
+
+def _write_parquet(df: pd.DataFrame, file_name: pathlib.Path) -> None:
+    # timestamps are stored as naive UTC
+    if isinstance(df.index, pd.DatetimeIndex) and (df.index.tz is not None):
+        df = df.tz_convert(None)
+
+    _to_polars(df.reset_index()).write_parquet(file_name, compression="zstd")
+
+def _write_csv(df: pd.DataFrame, file_name: pathlib.Path) -> None:
+    # polars' native writer, laid out like `DataFrame.to_csv`: an unnamed
+    # index gets an empty header, missing values are empty cells, and
+    # timestamps keep their UTC offset
+    datetime_format = "%Y-%m-%d %H:%M:%S"
+    tz = None
+    if isinstance(df.index, pd.DatetimeIndex):
+        # sub-second digits only when some timestamp actually has them
+        if (df.index.microsecond != 0).any():
+            datetime_format += "%.6f"
+        tz = df.index.tz
+    if tz is not None:
+        df = df.tz_convert(None)
+        datetime_format += "%:z"
+
+    frame = df.reset_index(names=df.index.name or "")
+    out = _to_polars(frame)
+    if tz is not None:
+        out = out.with_columns(
+            pl.col(frame.columns[0]).dt.replace_time_zone("UTC")
+        )
+
+    # polars quotes an empty column name, so the header row is written here
+    # with the same csv quoting rules pandas uses
+    with open(file_name, "w", newline="") as file:
+        csv.writer(file, lineterminator="\n").writerow(frame.columns)
+        out.write_csv(
+            file,
+            include_header=False,
+            datetime_format=datetime_format,
+        )
+
+def _write_charts(
+    date: pd.Timestamp,
+    data: dict,
+    target_dir: str | pathlib.Path,
+    file_format: str = "parquet",
+) -> None:
     dfs_and_names = convert_to_dataframes(data)
 
+    frames, file_paths = [], []
     for chart_title, df in dfs_and_names.items():
         # file_name = TARGET_DIR / (date.strftime("%Y%m%d") + "_" + chart_title + ".csv")
         file_name = (
             target_dir /
-            (date.strftime("%Y%m%d") + "_" + chart_title + ".csv")
+            (date.strftime("%Y%m%d") + "_" + chart_title + "." + file_format)
         )
-        df.to_csv(file_name)
+        frames.append(df)
+        file_paths.append(file_name)
+
+    # the charts are independent files, so write them side by side
+    write = _write_csv if file_format == "csv" else _write_parquet
+    with concurrent.futures.ThreadPoolExecutor() as pool:
+        list(pool.map(write, frames, file_paths))
+
+    # only written once every chart is on disk, so a day that failed partway
+    # through isn't mistaken for a finished one
+    if file_paths:
+        file_names = [file_path.name for file_path in file_paths]
+
+        # swapped into place in one step, so a crash can't leave a
+        # truncated manifest behind
+        manifest = _manifest_path(date, target_dir)
+        partial = manifest.with_name(manifest.name + ".tmp")
+        with open(partial, "w") as file:
+            json.dump({"files": file_names}, file, indent=2)
+        os.replace(partial, manifest)
+
 
 
+def _manifest_path(
+    date: pd.Timestamp,
+    target_dir: pathlib.Path,
+) -> pathlib.Path:
+    return target_dir / (date.strftime("%Y%m%d") + "_manifest.json")
+
+def _is_downloaded(date: pd.Timestamp, output_dir: pathlib.Path) -> bool:
+    manifest = _manifest_path(date, output_dir)
+    if manifest.exists():
+        # an unreadable manifest can't vouch for the day, so download it again
+        try:
+            with open(manifest, "r") as file:
+                file_names = json.load(file)["files"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        return all(
+            (output_dir / name).exists()
+            and ((output_dir / name).stat().st_size > 0)
+            for name in file_names
+        )
+
+    # days downloaded before there were manifests count as done if any of
+    # their charts are there. Those were all CSVs; parquet files without a
+    # manifest are left over from a day that failed partway through
+    prefix = date.strftime("%Y%m%d")
+    return any(
+        path.stat().st_size > 0
+        for path in output_dir.glob(f"{prefix}_*.csv")
+    )
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
 
 def download_date_range(
     start: str,
     end: str,
     output_dir: str | pathlib.Path,
     hybrid: bool,
+    workers: int | None = None,
+    prefer_static: bool = True,
+    force: bool = False,
+    file_format: str = "parquet",
 ):
+    if file_format not in ("parquet", "csv"):
+        raise ValueError(
+            f"'{file_format}' is not a recognized file format; must be one of "
+            "'parquet' or 'csv'"
+        )
+
     if not end:
         # CAISO seems to update the ESR on a two-day delay?
         end = (pd.Timestamp.now() - pd.Timedelta(days=2)).date()
@@ -287,5 +1003,57 @@ def download_date_range(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     dates = pd.date_range(start, end, freq="d")
-    for date in dates:
-        read_single_day_data(date, output_dir, hybrid)
+
+    if not force:
+        done = [_is_downloaded(date, output_dir) for date in dates]
+        if any(done):
+            print(f"Skipping {sum(done)} already-downloaded dates")
+            dates = dates[[not d for d in done]]
+
+    if dates.empty:
+        return
+
+    # with aiohttp around, try the static fast path for every date at once and
+    # only hand the misses to the browsers. `asyncio.run` can't be nested in
+    # a running loop (e.g. a notebook), so there each thread fetches its own
+    # date with requests instead
+    if (
+        prefer_static
+        and (not hybrid)
+        and (aiohttp is not None)
+        and (not _in_event_loop())
+    ):
+        urls = format_urls(dates)
+        results = asyncio.run(fetch_all(urls))
+
+        for date, data in zip(dates, results):
+            if data is not None:
+                _write_charts(date, data, output_dir, file_format)
+
+        dates = dates[[data is None for data in results]]
+        prefer_static = False
+
+        if dates.empty:
+            return
+
+    if workers is None:
+        workers = max(1, (os.cpu_count() or 2) // 2)
+    workers = max(1, min(workers, len(dates)))
+
+    # each date is independent, so spread them over a pool of threads that
+    # each drive their own headless Chrome. The scraping is all waiting on
+    # the network and the browser, so threads overlap it as well as processes
+    # would, while letting every thread keep its driver between dates
+    scrape = functools.partial(
+        read_single_day_data,
+        target_dir=output_dir,
+        hybrid=hybrid,
+        prefer_static=prefer_static,
+        file_format=file_format,
+        force=force,
+    )
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(scrape, dates))
+    finally:
+        _quit_all_drivers()